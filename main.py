@@ -7,81 +7,154 @@ network commands on specified devices.
 """
 
 import os
+from typing import Optional
+
 import typer
 from dotenv import load_dotenv
-from src.agents.simple_agent import SimpleNetworkAgent
 from src.core.config import settings
 
 
+# Load .env once per process rather than on every command invocation
+load_dotenv()
+
 app = typer.Typer()
 
+# Commands that end the interactive session
+EXIT_COMMANDS = frozenset({"quit", "exit"})
+
+# Static startup text, assembled once and written with a single print each
+BANNER = "🤖 Simplified AI Network Agent - Interactive Chat\n" + "=" * 60
+USAGE_HINT = (
+    "\n💡 Ask network questions like 'show interfaces on S1' or 'show version on R1'\n"
+    "   Type 'quit' or 'exit' to end the session.\n" + "=" * 60
+)
+DIVIDER = "-" * 40
+
+
+def _read_question() -> Optional[str]:
+    """Prompts the user until a non-empty question is entered.
+
+    Returns:
+        The stripped question, or None if the user asked to end the session
+    """
+    while True:
+        try:
+            # Get user input for network command
+            question = input("\n💬 You: ").strip()
+        except (KeyboardInterrupt, EOFError):
+            # Handle user interruption gracefully
+            return None
+
+        if not question:
+            # Skip empty input
+            continue
+        if question.lower() in EXIT_COMMANDS:
+            return None
+        return question
+
+
+def _create_agent(api_key: str):
+    """Creates the SimpleNetworkAgent, reporting the outcome to the user.
+
+    Args:
+        api_key: The API key for the Groq LLM service
+
+    Returns:
+        The initialized agent, or None if initialization failed
+    """
+    try:
+        # Deferred so the LangChain/Groq/Nornir import graph is only paid
+        # when a chat session actually starts (keeps `--help` fast).
+        from src.agents.simple_agent import SimpleNetworkAgent
+
+        agent = SimpleNetworkAgent(api_key=api_key)
+        print("✅ AI agent initialized successfully.")
+        return agent
+    except Exception as e:
+        print(f"❌ Error during initialization: {e}")
+        return None
+
+
+def _answer_question(agent, question: str) -> bool:
+    """Runs a single question through the agent and prints the result.
+
+    Args:
+        agent: The initialized SimpleNetworkAgent
+        question: Natural language request from the user
+
+    Returns:
+        False if the user interrupted the command and the session should end
+    """
+    print(DIVIDER)
+    try:
+        # Process the natural language request and execute command on device
+        result = agent.process_request(question)
+
+        # Write the whole answer in one call rather than one per line
+        print(
+            f"\n🖥️  Device: {result['device_name']}\n"
+            f"🔍 Command: {result['command']}\n"
+            f"\n📋 Output:\n{result['output']}"
+        )
+    except KeyboardInterrupt:
+        # Handle interruption during command execution
+        print("\n⚠️  Operation interrupted by user. Cleaning up connections...")
+        agent.close_sessions()
+        return False
+    except Exception as e:
+        # Handle any other errors during command processing
+        print(f"❌ An unexpected error occurred: {e}")
+    print(DIVIDER)
+    return True
+
 
 @app.command()
-def chat():
+def chat(
+    preload: bool = typer.Option(
+        False, "--preload", help="Initialize the agent before the first prompt."
+    ),
+):
     """Starts an interactive chat session with the network agent.
 
-    This function initializes the SimpleNetworkAgent with the GROQ API key,
-    then enters an interactive loop to process user queries. The process
-    involves LLM-based interpretation of natural language requests
-    and execution of appropriate network commands on the specified devices.
+    This function checks for the GROQ API key, then enters an interactive loop
+    to process user queries. The process involves LLM-based interpretation of
+    natural language requests and execution of appropriate network commands
+    on the specified devices.
     """
-    load_dotenv()
-    print("🤖 Simplified AI Network Agent - Interactive Chat")
-    print("=" * 60)
+    print(BANNER)
 
     groq_api_key = os.getenv("GROQ_API_KEY") or settings.groq_api_key
     if not groq_api_key:
         print("⚠️ GROQ_API_KEY not set! Please create a .env file with your key.")
         return
 
-    try:
-        agent = SimpleNetworkAgent(api_key=groq_api_key)
-        print("✅ AI agent initialized successfully.")
-    except Exception as e:
-        print(f"❌ Error during initialization: {e}")
-        return
+    agent = None
+    if preload:
+        agent = _create_agent(groq_api_key)
+        if agent is None:
+            return
 
-    print("\n💡 Ask network questions like 'show interfaces on S1' or 'show version on R1'")
-    print("   Type 'quit' or 'exit' to end the session.")
-    print("=" * 60)
+    print(USAGE_HINT)
 
     try:
         while True:
-            try:
-                # Get user input for network command
-                question = input("\n💬 You: ").strip()
-            except (KeyboardInterrupt, EOFError):
-                # Handle user interruption gracefully
+            question = _read_question()
+            if question is None:
                 break
 
-            if not question:
-                # Skip empty input
-                continue
-            question_lower = question.lower()
-            if question_lower in ["quit", "exit"]:
-                # Break the loop if user wants to exit
-                break
+            if agent is None:
+                # Lazily initialize the agent on the first real question so
+                # sessions that only exit skip LLM client and Nornir setup
+                agent = _create_agent(groq_api_key)
+                if agent is None:
+                    break
 
-            print("-" * 40)
-            try:
-                # Process the natural language request and execute command on device
-                result = agent.process_request(question)
-
-                print(f"\n🖥️  Device: {result['device_name']}")
-                print(f"🔍 Command: {result['command']}")
-                print(f"\n📋 Output:\n{result['output']}")
-            except KeyboardInterrupt:
-                # Handle interruption during command execution
-                print("\n⚠️  Operation interrupted by user. Cleaning up connections...")
-                agent.close_sessions()
+            if not _answer_question(agent, question):
                 break
-            except Exception as e:
-                # Handle any other errors during command processing
-                print(f"❌ An unexpected error occurred: {e}")
-            print("-" * 40)
     finally:
         # Ensure all network sessions are closed even if an error occurs
-        agent.close_sessions()
+        if agent is not None:
+            agent.close_sessions()
         print("\n👋 All network sessions closed. Goodbye!")
 
 
@@ -4,9 +4,11 @@ This module implements a simple AI agent that interprets natural language reques
 and executes appropriate network commands using Nornir.
 """
 
-from typing import Dict
+import re
+from collections import OrderedDict
+from typing import Dict, List, Optional
 
-from langchain_core.prompts import PromptTemplate
+from langchain_core.prompts import ChatPromptTemplate
 from langchain_core.pydantic_v1 import BaseModel, Field
 from langchain_groq import ChatGroq
 
@@ -14,6 +16,54 @@ from src.core.config import settings
 from src.core.network_manager import NetworkManager
 
 
+# The system message is static and comes first so the provider sees a
+# byte-identical prefix on every request; only the human turn varies.
+COMMAND_EXTRACTION_PROMPT = ChatPromptTemplate.from_messages(
+    [
+        (
+            "system",
+            """You are a network assistant. Extract the device name and network command from the user's request.
+
+Provide the device name and the network command to execute in JSON format.
+If the user doesn't specify a particular device, choose one from the available devices.
+
+Respond with a JSON object like this:
+{{
+    "device_name": "device_name",
+    "command": "the network command to execute"
+}}
+
+Network commands should be standard CLI commands like 'show version', 'show interfaces', etc.""",
+        ),
+        (
+            "human",
+            "User request: {user_input}\n\nAvailable devices: {available_devices}",
+        ),
+    ]
+)
+
+
+# Requests of the form "<known command> on <device>" are executed without the LLM
+SHORTCUT_COMMANDS = (
+    "show version",
+    "show ip interface brief",
+    "show interfaces",
+    "show ip route",
+    "show running-config",
+    "show vlan brief",
+    "show cdp neighbors",
+    "show clock",
+)
+
+_SHORTCUT_PATTERN = re.compile(
+    r"^(?P<command>"
+    # Longest alternatives first so a command is never cut short by its prefix
+    + "|".join(map(re.escape, sorted(SHORTCUT_COMMANDS, key=len, reverse=True)))
+    + r") on (?P<device>\S+)$",
+    re.IGNORECASE,
+)
+
+
 class NetworkCommand(BaseModel):
     """Model for extracted network command information.
 
@@ -37,6 +87,7 @@ class SimpleNetworkAgent:
         network_manager: Instance of NetworkManager for executing commands on devices
         prompt_template: Template for formatting requests to the LLM
         extractor: LLM with structured output for extracting device and command
+        _command_cache: LRU cache of extracted commands keyed by normalized request
     """
 
     def __init__(self, api_key: str):
@@ -49,30 +100,90 @@ class SimpleNetworkAgent:
             groq_api_key=api_key,
             model_name=settings.groq_model_name,
             temperature=settings.groq_temperature,
+            max_retries=settings.groq_max_retries,
         )
         self.network_manager = NetworkManager()
 
-        self.prompt_template = PromptTemplate.from_template(
-            """You are a network assistant. Extract the device name and network command from the user's request.
+        self.prompt_template = COMMAND_EXTRACTION_PROMPT
 
-User request: {user_input}
+        self.extractor = self.prompt_template | self.llm.with_structured_output(
+            NetworkCommand
+        )
+        # Initialize cache for LLM extractions of repeated requests
+        self._command_cache: OrderedDict[str, NetworkCommand] = OrderedDict()
 
-Provide the device name and the network command to execute in JSON format.
-If the user doesn't specify a particular device, choose one from the network: {available_devices}
+    def _match_shortcut(
+        self, user_input: str, available_devices: List[str]
+    ) -> Optional[NetworkCommand]:
+        """Resolve a request that names a known command and device directly.
 
-Respond with a JSON object like this:
-{{
-    "device_name": "device_name",
-    "command": "the network command to execute"
-}}
+        Args:
+            user_input: Natural language request from the user
+            available_devices: Device names in the inventory
 
-Network commands should be standard CLI commands like 'show version', 'show interfaces', etc."""
-        )
+        Returns:
+            The device name and command, or None if the request needs the LLM
+        """
+        match = _SHORTCUT_PATTERN.match(" ".join(user_input.split()))
+        if match is None:
+            return None
+
+        # Only short-circuit when the device exists (case-insensitively)
+        requested_device = match.group("device").lower()
+        for device_name in available_devices:
+            if device_name.lower() == requested_device:
+                return NetworkCommand(
+                    device_name=device_name, command=match.group("command").lower()
+                )
+        return None
+
+    @staticmethod
+    def _cache_key(user_input: str) -> str:
+        """Normalize a request into its command cache key.
 
-        self.extractor = self.prompt_template | self.llm.with_structured_output(
-            NetworkCommand
+        Args:
+            user_input: Natural language request from the user
+
+        Returns:
+            The request with whitespace collapsed
+        """
+        # Collapse whitespace so trivially different spellings share an entry
+        return " ".join(user_input.split())
+
+    def _extract_command(
+        self, user_input: str, available_devices: List[str]
+    ) -> NetworkCommand:
+        """Extract the device and command for a request, reusing earlier results.
+
+        Only the LLM extraction is cached; the command itself is always executed
+        so device output is never stale.
+
+        Args:
+            user_input: Natural language request from the user
+            available_devices: Device names the LLM may choose from
+
+        Returns:
+            The extracted device name and command
+        """
+        cache_key = self._cache_key(user_input)
+
+        # Use the cached extraction if this request was seen before
+        cached = self._command_cache.get(cache_key)
+        if cached is not None:
+            self._command_cache.move_to_end(cache_key)
+            return cached
+
+        # Use LLM to extract device name and command from user input
+        result: NetworkCommand = self.extractor.invoke(
+            {"user_input": user_input, "available_devices": available_devices}
         )
 
+        # Cache the extraction, evicting the least recently used entries
+        self._command_cache[cache_key] = result
+        while len(self._command_cache) > settings.command_cache_size:
+            self._command_cache.popitem(last=False)
+        return result
+
     def process_request(self, user_input: str) -> Dict[str, str]:
         """Process a natural language request and execute the appropriate command.
 
@@ -85,15 +196,21 @@ Network commands should be standard CLI commands like 'show version', 'show inte
         # Get list of available network devices
         available_devices = self.network_manager.get_device_names()
 
-        # Use LLM to extract device name and command from user input
-        result: NetworkCommand = self.extractor.invoke(
-            {"user_input": user_input, "available_devices": available_devices}
-        )
+        # Resolve known "<command> on <device>" requests without the LLM
+        result = self._match_shortcut(user_input, available_devices)
+        if result is None:
+            # Use LLM to extract device name and command (reused for repeats)
+            result = self._extract_command(user_input, available_devices)
 
         # Execute the extracted command on the specified device
-        output = self.network_manager.execute_command(
-            result.device_name, result.command
-        )
+        try:
+            output = self.network_manager.execute_command(
+                result.device_name, result.command
+            )
+        except Exception:
+            # Forget the extraction so retrying the request asks the LLM again
+            self._command_cache.pop(self._cache_key(user_input), None)
+            raise
 
         # Return structured response containing device, command, and output
         return {
@@ -4,9 +4,18 @@ This package contains the fundamental building blocks of the network management
 - NetworkManager: Handles device connections and command execution using Nornir
 - Config: Centralized application settings and configuration management
 - Models: Pydantic models for structured data contracts
-"""
 
-from .network_manager import NetworkManager
+NetworkManager is resolved lazily so that importing ``src.core.config`` (as the
+CLI does at startup) does not pull in Nornir and Netmiko.
+"""
 
 __all__ = ["NetworkManager"]
 
+
+def __getattr__(name):
+    """Lazily import NetworkManager on first attribute access."""
+    if name == "NetworkManager":
+        from .network_manager import NetworkManager
+
+        return NetworkManager
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -5,6 +5,7 @@ It loads configuration values from environment variables or a .env file and
 exposes a single settings instance that can be imported throughout the application.
 """
 
+from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -18,13 +19,19 @@ class Settings(BaseSettings):
         nornir_inventory_dir (str): Path to the Nornir inventory directory.
         groq_model_name (str): Name of the LLM model to use with Groq API.
         groq_temperature (float): Temperature setting for the LLM (controls randomness).
+        groq_max_retries (int): Retries for rate-limited (429) or failed Groq requests,
+            with exponential backoff that honors Retry-After.
         groq_api_key (str): API key for Groq service (can be empty if provided via environment).
+        command_cache_size (int): Number of extracted commands the agent keeps for
+            repeated requests (0 disables the cache; must not be negative).
     """
 
     nornir_inventory_dir: str = "inventory"
     groq_model_name: str = "llama-3.3-70b-versatile"
     groq_temperature: float = 0.3
+    groq_max_retries: int = 5
     groq_api_key: str = ""
+    command_cache_size: int = Field(default=128, ge=0)
 
     model_config = SettingsConfigDict(
         env_file=".env",
@@ -5,9 +5,9 @@ using Nornir and executes commands using the nornir-netmiko plugin.
 """
 
 from typing import Dict, List
-from functools import lru_cache
 
 from nornir import InitNornir
+from nornir.core import Nornir
 from nornir_netmiko import netmiko_send_command
 
 from src.core.config import settings
@@ -94,6 +94,20 @@ class NetworkManager:
         # Return the command output
         return host_result.result
 
+    def _filter_devices(self, device_names: List[str]) -> Nornir:
+        """Returns a Nornir object restricted to the given devices.
+
+        Args:
+            device_names (List[str]): Names of the devices to target.
+
+        Returns:
+            Nornir: Filtered Nornir instance containing only those devices.
+        """
+        # filter(name=[...]) compares each host name to the whole list and
+        # matches nothing, so select hosts by membership instead
+        names = set(device_names)
+        return self.nornir.filter(filter_func=lambda host: host.name in names)
+
     def execute_command_on_multiple_devices(
         self, device_names: List[str], command: str
     ) -> Dict[str, str]:
@@ -107,7 +121,7 @@ class NetworkManager:
             Dict[str, str]: Dictionary mapping device names to command outputs.
         """
         # Filter the Nornir inventory to target the specific devices
-        filtered_nornir = self.nornir.filter(name=device_names)
+        filtered_nornir = self._filter_devices(device_names)
 
         # Execute the command on all specified devices simultaneously
         results = filtered_nornir.run(task=netmiko_send_command, command_string=command)
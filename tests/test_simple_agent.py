@@ -2,7 +2,9 @@
 
 import pytest
 from unittest.mock import Mock, patch, MagicMock
+from pydantic import ValidationError
 from src.agents.simple_agent import SimpleNetworkAgent, NetworkCommand
+from src.core.config import Settings, settings
 from src.core.network_manager import NetworkManager
 
 
@@ -22,7 +24,8 @@ class TestSimpleNetworkAgent:
             mock_chat_groq.assert_called_once()
             call_args = mock_chat_groq.call_args
             assert call_args[1]["groq_api_key"] == api_key
-            assert call_args[1]["model_name"] == "llama3-70b-4096"
+            assert call_args[1]["model_name"] == settings.groq_model_name
+            assert call_args[1]["max_retries"] == settings.groq_max_retries
 
     def test_process_request(self):
         """Test process_request method."""
@@ -44,7 +47,7 @@ class TestSimpleNetworkAgent:
                         command="show version"
                     )
 
-                    result = agent.process_request("show version on R1")
+                    result = agent.process_request("what version is R1 running?")
 
                     assert result["device_name"] == "R1"
                     assert result["command"] == "show version"
@@ -53,6 +56,162 @@ class TestSimpleNetworkAgent:
                     mock_extractor.invoke.assert_called_once()
                     mock_network_instance.execute_command.assert_called_once_with("R1", "show version")
 
+    def test_process_request_reuses_cached_extraction(self):
+        """Test repeated requests skip the LLM but still execute the command."""
+        api_key = "test_api_key"
+
+        with patch("src.agents.simple_agent.ChatGroq"):
+            with patch("src.agents.simple_agent.NetworkManager") as mock_network_mgr_class:
+                mock_network_instance = Mock()
+                mock_network_instance.get_device_names.return_value = ["R1", "S1"]
+                mock_network_instance.execute_command.return_value = "Mock command output"
+
+                mock_network_mgr_class.return_value = mock_network_instance
+
+                agent = SimpleNetworkAgent(api_key=api_key)
+
+                with patch.object(agent, 'extractor') as mock_extractor:
+                    mock_extractor.invoke.return_value = NetworkCommand(
+                        device_name="R1",
+                        command="show version"
+                    )
+
+                    agent.process_request("what version is R1 running?")
+                    result = agent.process_request("  what version is  R1 running? ")
+
+                    assert result["device_name"] == "R1"
+                    assert result["command"] == "show version"
+                    mock_extractor.invoke.assert_called_once()
+                    assert mock_network_instance.execute_command.call_count == 2
+
+    def test_process_request_failed_command_is_not_cached(self):
+        """Test a request whose command fails asks the LLM again on retry."""
+        api_key = "test_api_key"
+
+        with patch("src.agents.simple_agent.ChatGroq"):
+            with patch("src.agents.simple_agent.NetworkManager") as mock_network_mgr_class:
+                mock_network_instance = Mock()
+                mock_network_instance.get_device_names.return_value = ["R1", "S1"]
+                mock_network_instance.execute_command.side_effect = [
+                    ValueError("Device 'R9' not found in inventory."),
+                    "Mock command output",
+                ]
+
+                mock_network_mgr_class.return_value = mock_network_instance
+
+                agent = SimpleNetworkAgent(api_key=api_key)
+
+                with patch.object(agent, 'extractor') as mock_extractor:
+                    mock_extractor.invoke.side_effect = [
+                        NetworkCommand(device_name="R9", command="show version"),
+                        NetworkCommand(device_name="R1", command="show version"),
+                    ]
+
+                    with pytest.raises(ValueError, match="R9"):
+                        agent.process_request("what version is R1 running?")
+                    result = agent.process_request("what version is R1 running?")
+
+                    assert result["device_name"] == "R1"
+                    assert result["output"] == "Mock command output"
+                    assert mock_extractor.invoke.call_count == 2
+
+    def test_process_request_cache_disabled(self):
+        """Test a command cache size of 0 sends every request to the LLM."""
+        api_key = "test_api_key"
+
+        with patch("src.agents.simple_agent.ChatGroq"):
+            with patch("src.agents.simple_agent.NetworkManager") as mock_network_mgr_class:
+                mock_network_instance = Mock()
+                mock_network_instance.get_device_names.return_value = ["R1", "S1"]
+                mock_network_instance.execute_command.return_value = "Mock command output"
+
+                mock_network_mgr_class.return_value = mock_network_instance
+
+                agent = SimpleNetworkAgent(api_key=api_key)
+
+                with patch.object(settings, "command_cache_size", 0):
+                    with patch.object(agent, 'extractor') as mock_extractor:
+                        mock_extractor.invoke.return_value = NetworkCommand(
+                            device_name="R1",
+                            command="show version"
+                        )
+
+                        agent.process_request("what version is R1 running?")
+                        agent.process_request("what version is R1 running?")
+
+                        assert mock_extractor.invoke.call_count == 2
+
+    def test_process_request_cache_evicts_least_recently_used(self):
+        """Test the command cache evicts the least recently used request."""
+        api_key = "test_api_key"
+
+        with patch("src.agents.simple_agent.ChatGroq"):
+            with patch("src.agents.simple_agent.NetworkManager") as mock_network_mgr_class:
+                mock_network_instance = Mock()
+                mock_network_instance.get_device_names.return_value = ["R1", "S1"]
+                mock_network_instance.execute_command.return_value = "Mock command output"
+
+                mock_network_mgr_class.return_value = mock_network_instance
+
+                agent = SimpleNetworkAgent(api_key=api_key)
+
+                with patch.object(settings, "command_cache_size", 2):
+                    with patch.object(agent, 'extractor') as mock_extractor:
+                        mock_extractor.invoke.return_value = NetworkCommand(
+                            device_name="R1",
+                            command="show version"
+                        )
+
+                        agent.process_request("first request")
+                        agent.process_request("second request")
+                        # Touch the first request so the second becomes the oldest
+                        agent.process_request("first request")
+                        agent.process_request("third request")
+                        assert mock_extractor.invoke.call_count == 3
+
+                        agent.process_request("first request")
+                        assert mock_extractor.invoke.call_count == 3
+
+                        agent.process_request("second request")
+                        assert mock_extractor.invoke.call_count == 4
+
+    def test_command_cache_size_rejects_negative(self):
+        """Test a negative command cache size is rejected by the settings."""
+        with pytest.raises(ValidationError):
+            Settings(command_cache_size=-1)
+
+    def test_process_request_shortcut_skips_llm(self):
+        """Test a known command on a named device bypasses the LLM."""
+        api_key = "test_api_key"
+
+        with patch("src.agents.simple_agent.ChatGroq"):
+            with patch("src.agents.simple_agent.NetworkManager") as mock_network_mgr_class:
+                mock_network_instance = Mock()
+                mock_network_instance.get_device_names.return_value = ["R1", "S1"]
+                mock_network_instance.execute_command.return_value = "Mock command output"
+
+                mock_network_mgr_class.return_value = mock_network_instance
+
+                agent = SimpleNetworkAgent(api_key=api_key)
+
+                with patch.object(agent, 'extractor') as mock_extractor:
+                    result = agent.process_request("Show IP Interface Brief on s1")
+
+                    assert result["device_name"] == "S1"
+                    assert result["command"] == "show ip interface brief"
+                    mock_extractor.invoke.assert_not_called()
+                    mock_network_instance.execute_command.assert_called_once_with(
+                        "S1", "show ip interface brief"
+                    )
+
+                    # Unknown devices still go through the LLM
+                    mock_extractor.invoke.return_value = NetworkCommand(
+                        device_name="R1",
+                        command="show version"
+                    )
+                    agent.process_request("show version on all devices")
+                    mock_extractor.invoke.assert_called_once()
+
     def test_close_sessions(self):
         """Test close_sessions method."""
         api_key = "test_api_key"
@@ -157,25 +316,17 @@ class TestNetworkManager:
             mock_filtered_inventory.hosts = {"R1": Mock(), "S1": Mock(), "S2": Mock()}
             mock_filtered_nornir.inventory = mock_filtered_inventory
 
-            mock_result = Mock()
-
-            def getitem_side_effect(key):
-                item_result = Mock()
-                if key == "R1":
-                    item_result.failed = False
-                    item_result.result = "R1 output"
-                elif key == "S1":
-                    item_result.failed = False
-                    item_result.result = "S1 output"
-                elif key == "S2":
-                    item_result.failed = True
-                    item_result.result = "Error occurred"
-                else:
-                    item_result.failed = True
-                    item_result.result = "Device not found in results"
-                return item_result
-
-            mock_result.__getitem__ = Mock(side_effect=getitem_side_effect)
+            # AggregatedResult is a dict of host name to MultiResult
+            mock_result = {}
+            for name, failed, output in [
+                ("R1", False, "R1 output"),
+                ("S1", False, "S1 output"),
+                ("S2", True, "Error occurred"),
+            ]:
+                host_result = Mock()
+                host_result.failed = failed
+                host_result.result = output
+                mock_result[name] = host_result
 
             mock_filtered_nornir.run.return_value = mock_result
 
@@ -193,4 +344,12 @@ class TestNetworkManager:
                 "S1": "S1 output",
                 "S2": "Error: Error occurred"
             }
-            assert outputs == expected_outputs
\ No newline at end of file
+            assert outputs == expected_outputs
+
+    def test_filter_devices_selects_requested_hosts(self):
+        """Test _filter_devices selects hosts by name from the real inventory."""
+        manager = NetworkManager(config_file="inventory/config.yaml")
+
+        filtered_nornir = manager._filter_devices(["R1", "S2", "X9"])
+
+        assert sorted(filtered_nornir.inventory.hosts) == ["R1", "S2"]